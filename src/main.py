@@ -16,20 +16,23 @@ Gebruik:
 
 from __future__ import annotations
 
+import functools
+import gc
 import random
-import re
+import sys
 from dataclasses import dataclass
-from typing import List, Tuple, Optional, cast
+from typing import Dict, List, Tuple
 
 # Dataset met werkwoorden, tijden en zinnen (+ gedeelde Literal-typen voor type-checking)
 try:
     # Uitvoer via module (aanbevolen): python -m Werkwoorden.src.main
     from .verbs_data import (
         TENSES,
-        VERBS,
-        AUX_CONJUGATION,
+        PERFECT_ANSWERS,
+        TEMPLATES_BY_TENSE,
+        check_answer,
         get_finite_form,
-        list_templates_for_tense,
+        list_verbs_for_template,
         TenseCode,
         Pronoun,
     )
@@ -37,118 +40,80 @@ except Exception:
     # Fallback voor directe uitvoer als script: python Werkwoorden/src/main.py
     from verbs_data import (  # type: ignore
         TENSES,
-        VERBS,
-        AUX_CONJUGATION,
+        PERFECT_ANSWERS,
+        TEMPLATES_BY_TENSE,
+        check_answer,
         get_finite_form,
-        list_templates_for_tense,
+        list_verbs_for_template,
         TenseCode,
         Pronoun,
     )
 
 
-@dataclass
+# Tijdcodes (al geïnterneerd in verbs_data) en hun labels; de dataset is statisch,
+# dus dit hoeft maar één keer bij import te gebeuren in plaats van per vraag.
+_TENSE_CODES: Tuple[TenseCode, ...] = tuple(TENSES)
+_TENSE_LABELS: Dict[TenseCode, str] = {t: TENSES[t]["label"] for t in _TENSE_CODES}  # type: ignore[misc]
+
+
+@dataclass(slots=True, frozen=True)
 class Question:
     template_id: str
     template_text: str
     tense: TenseCode
     pronoun: Pronoun
     verb_infinitive: str
-    expected_answers: List[str]  # genormaliseerde correcte antwoorden
-    display_answers: List[str]  # nette weergave voor feedback
+    display_answers: Tuple[str, ...]  # correcte antwoorden, nette weergave voor feedback
     explanation: str  # korte uitleg
     hint: str  # bijv. 'o.t.t.'
+    wrong_answer_feedback: str  # kant-en-klare feedback bij een fout antwoord
 
 
-def normalize_answer(s: str) -> str:
-    """
-    Normaliseer een antwoord voor robuuste vergelijking:
-    - lowercase
-    - trimmen
-    - samenvouwen van whitespace
-    - verwijderen van eenvoudige eind-interpunctie
+@functools.lru_cache(maxsize=4096)
+def build_expected_answers(verb: str, tense: TenseCode, pronoun: Pronoun) -> Tuple[str, ...]:
     """
-    s = s.strip().lower()
-    s = re.sub(r"[.,;:!?]+$", "", s)
-    s = re.sub(r"\s+", " ", s)
-    return s
-
-
-def build_expected_answers(verb: str, tense: TenseCode, pronoun: Pronoun) -> Tuple[List[str], List[str]]:
-    """
-    Bouw alle acceptabele antwoorden voor een vraag:
+    Bouw alle correcte antwoorden voor een vraag (nette weergave, voor de feedback):
     - Voor o.t.t./o.v.t.: exacte vervoeging van het gekozen werkwoord.
-    - Voor v.t.t./v.v.t.: alle combinaties van juiste hulpwerkwoord(en) + voltooid deelwoord.
-      Als een werkwoord beide hulpwerkwoorden kan hebben (bijv. 'lopen'), accepteer beide.
-    Retourneert (genormaliseerde_varianten, nette_weergave_varianten).
+    - Voor v.t.t./v.v.t.: juiste hulpwerkwoord(en) + voltooid deelwoord.
+      Als een werkwoord beide hulpwerkwoorden kan hebben (bijv. 'lopen'), tonen we beide.
+    Of een antwoord goed is, bepaalt check_answer; het resultaat hier wordt per
+    (werkwoord, tijd, onderwerp) gecachet omdat de dataset vast is.
     """
-    entry = VERBS[verb]
-    display_variants: List[str] = []
-    normalized_variants: List[str] = []
-
     if tense in ("o.t.t.", "o.v.t."):
-        finite = get_finite_form(verb, tense, pronoun)
-        display_variants.append(finite)
-        normalized_variants.append(normalize_answer(finite))
-        return normalized_variants, display_variants
-
-    # Perfecte tijden: v.t.t. / v.v.t.
-    aux_time_value = cast(Optional[str], TENSES[tense].get("aux_time"))
-    assert aux_time_value in ("o.t.t.", "o.v.t.")
-    aux_time = cast(TenseCode, aux_time_value)
-
-    aux_val = entry.get("aux")
-    if aux_val is None:
-        raise KeyError(f"Verb-entry mist 'aux' voor {verb}")
-    past_participle = entry.get("past_participle")
-    if past_participle is None:
-        raise KeyError(f"Verb-entry mist 'past_participle' voor {verb}")
-
-    aux_list = aux_val if isinstance(aux_val, list) else [aux_val]
-    for aux_name in aux_list:
-        aux_form = AUX_CONJUGATION[aux_name][aux_time][pronoun]
-        phrase = f"{aux_form} {past_participle}"
-        display_variants.append(phrase)
-        normalized_variants.append(normalize_answer(phrase))
-
-    # Uniek maken (sommige combinaties kunnen gelijk zijn)
-    seen = set()
-    unique_norm: List[str] = []
-    unique_disp: List[str] = []
-    for n, d in zip(normalized_variants, display_variants):
-        if n not in seen:
-            seen.add(n)
-            unique_norm.append(n)
-            unique_disp.append(d)
-
-    return unique_norm, unique_disp
+        return (get_finite_form(verb, tense, pronoun),)
+    # Perfecte tijden: v.t.t. / v.v.t. (één frase per toegestaan hulpwerkwoord)
+    return PERFECT_ANSWERS[(verb, tense, pronoun)]
 
 
 def pick_question(tense: TenseCode) -> Question:
     """
     Kies willekeurig een sjabloon (zin) voor de gevraagde tijd en een passend werkwoord.
     """
-    templates = list_templates_for_tense(tense)
-    tmpl = random.choice(templates)
+    tmpl = random.choice(TEMPLATES_BY_TENSE[tense])
 
-    allowed_verbs = cast(Optional[List[str]], tmpl.get("allowed_verbs"))
-    if not allowed_verbs:
-        allowed_verbs = list(VERBS.keys())
-    verb = random.choice(allowed_verbs)
+    tmpl_id = tmpl.id
+    tmpl_text = tmpl.template
+    verb = random.choice(list_verbs_for_template(tmpl))
+    tmpl_pronoun = tmpl.pronoun
 
-    tmpl_pronoun = cast(Optional[Pronoun], tmpl.get("pronoun"))
-    if tmpl_pronoun is None:
-        raise KeyError(f"Template '{tmpl.get('id','?')}' mist 'pronoun'")
+    disp = build_expected_answers(verb, tense, tmpl_pronoun)
+    label = _TENSE_LABELS[tense]
+    hint = tmpl.hint or tense
 
-    norm, disp = build_expected_answers(verb, tense, tmpl_pronoun)
-    label = cast(str, TENSES[tense]["label"])
-    hint = cast(str, tmpl.get("hint", tense))
+    explanation = f"Tijd: {tense} ({label}). Onderwerp: {tmpl_pronoun}. Werkwoord: {verb}."
 
-    tmpl_id = cast(Optional[str], tmpl.get("id"))
-    tmpl_text = cast(Optional[str], tmpl.get("template"))
-    if tmpl_id is None or tmpl_text is None:
-        raise KeyError("Template mist 'id' of 'template'")
+    # Feedback bij een fout antwoord alvast opbouwen, buiten het interactieve pad
+    lines = ["❌ Niet correct."]
+    # Toon alle mogelijke correcte antwoorden, netjes geformatteerd
+    if len(disp) == 1:
+        lines.append(f"Correcte antwoord: {disp[0]}")
+    else:
+        lines.append("Mogelijke correcte antwoorden:")
+        lines.extend(f" - {ans}" for ans in disp)
 
-    explanation = f"Tijd: {tense} ({label}). Onderwerp: {tmpl_pronoun}. Werkwoord: {verb}."
+    # Extra uitleg bij perfecte tijden
+    if tense in ("v.t.t.", "v.v.t."):
+        lines.append("Let op: bij de voltooide tijden gebruik je het juiste hulpwerkwoord ('hebben' of 'zijn') plus het voltooid deelwoord.")
 
     return Question(
         template_id=tmpl_id,
@@ -156,10 +121,10 @@ def pick_question(tense: TenseCode) -> Question:
         tense=tense,
         pronoun=tmpl_pronoun,
         verb_infinitive=verb,
-        expected_answers=norm,
         display_answers=disp,
         explanation=explanation,
         hint=hint,
+        wrong_answer_feedback="\n".join(lines),
     )
 
 
@@ -168,30 +133,26 @@ def ask_question(q: Question, question_number: int, total: int) -> bool:
     Toon de vraag, vraag om invoer en geef feedback.
     Retourneert True bij goed antwoord, anders False.
     """
-    print()
-    print(f"[{question_number}/{total}] {q.explanation}")
-    print(f"Zin ({q.hint}): {q.template_text}")
-    print("Vul de juiste vervoeging in op de plek van de '____'.")
-    print(f"Te vervoegen werkwoord: {q.verb_infinitive}")
+    # Alle vraagregels in één write; input() flusht stdout vóór het lezen.
+    sys.stdout.write(
+        "\n".join(
+            (
+                "",
+                f"[{question_number}/{total}] {q.explanation}",
+                f"Zin ({q.hint}): {q.template_text}",
+                "Vul de juiste vervoeging in op de plek van de '____'.",
+                f"Te vervoegen werkwoord: {q.verb_infinitive}",
+                "",
+            )
+        )
+    )
     user = input("Jouw antwoord: ").strip()
-    normalized_user = normalize_answer(user)
-
-    correct = normalized_user in q.expected_answers
+    # Eén gedeelde antwoordindex (zelfde normalisatie als de dataset)
+    correct = (q.verb_infinitive, q.tense, q.pronoun) in check_answer(user)
     if correct:
         print("✅ Correct!")
     else:
-        print("❌ Niet correct.")
-        # Toon alle mogelijke correcte antwoorden, netjes geformatteerd
-        if len(q.display_answers) == 1:
-            print(f"Correcte antwoord: {q.display_answers[0]}")
-        else:
-            print("Mogelijke correcte antwoorden:")
-            for ans in q.display_answers:
-                print(f" - {ans}")
-
-        # Extra uitleg bij perfecte tijden
-        if q.tense in ("v.t.t.", "v.v.t."):
-            print("Let op: bij de voltooide tijden gebruik je het juiste hulpwerkwoord ('hebben' of 'zijn') plus het voltooid deelwoord.")
+        print(q.wrong_answer_feedback)
     return correct
 
 
@@ -199,17 +160,18 @@ def select_tenses_interactive() -> List[TenseCode]:
     """
     Laat de gebruiker kiezen welke tijden geoefend worden.
     """
-    all_tenses: List[TenseCode] = ["o.t.t.", "o.v.t.", "v.t.t.", "v.v.t."]
-    labels = {t: cast(str, TENSES[t]["label"]) for t in all_tenses}
+    all_tenses: List[TenseCode] = list(_TENSE_CODES)
     print("Welke tijden wil je oefenen? (meerdere keuzes toegestaan)")
     for idx, t in enumerate(all_tenses, start=1):
-        print(f"{idx}. {t} ({labels[t]})")
+        print(f"{idx}. {t} ({_TENSE_LABELS[t]})")
     print("Kies nummers, gescheiden door komma. Voorbeeld: 1,3,4")
     choice = input("Jouw keuze [enter = alle]: ").strip()
     if not choice:
         return all_tenses
 
-    nums = re.findall(r"\d+", choice)
+    # Komma, puntkomma en spaties gelden allemaal als scheidingsteken
+    parts = choice.replace(",", " ").replace(";", " ").split()
+    nums = [p for p in parts if p.isdecimal()]
     picked: List[TenseCode] = []
     for n in nums:
         i = int(n)
@@ -227,21 +189,39 @@ def ask_int(prompt: str, default: int, min_value: int = 1, max_value: int = 1000
     val = input("> ").strip()
     if not val:
         return default
-    try:
-        n = int(val)
-        if n < min_value or n > max_value:
-            print(f"Waarde buiten bereik [{min_value}-{max_value}]. Default {default} gebruikt.")
-            return default
-        return n
-    except ValueError:
+    # Valideer vooraf i.p.v. een ValueError van int() af te vangen
+    digits = val[1:] if val[0] in "+-" else val
+    if not digits.isdecimal():
         print(f"Ongeldige invoer. Default {default} gebruikt.")
         return default
+    n = int(val)
+    if n < min_value or n > max_value:
+        print(f"Waarde buiten bereik [{min_value}-{max_value}]. Default {default} gebruikt.")
+        return default
+    return n
+
+
+def warm_caches() -> None:
+    """
+    Vul de antwoord-caches vooraf voor alle (sjabloon, werkwoord)-combinaties,
+    zodat de eerste vraag niet merkbaar trager is dan de rest.
+    Gebruikt geen random, dus de volgorde van de vragen verandert niet.
+    """
+    for tense, templates in TEMPLATES_BY_TENSE.items():
+        for tmpl in templates:
+            for verb in list_verbs_for_template(tmpl):
+                build_expected_answers(verb, tense, tmpl.pronoun)
 
 
 def run_session():
     print("Welkom bij de Werkwoorden Trainer!")
     print("Je gaat werkwoorden vervoegen in voorbereide zinnen.")
     print("We tonen steeds het werkwoord (infinitief) dat je moet vervoegen en de gevraagde tijd.\n")
+    # Eenmalige kosten naar voren halen terwijl de gebruiker het menu leest
+    warm_caches()
+    # Alle statische data en caches staan nu klaar: uit de GC-generaties halen
+    gc.collect()
+    gc.freeze()
 
     tenses = select_tenses_interactive()
     total = ask_int("Hoeveel vragen wil je?", default=10, min_value=1, max_value=500)
@@ -249,10 +229,11 @@ def run_session():
 
     correct_count = 0
     asked = 0
+    # Trek de tijden voor de hele sessie in één keer
+    tense_seq = random.choices(tenses, k=total)
 
     try:
-        for i in range(1, total + 1):
-            tense = random.choice(tenses)
+        for i, tense in enumerate(tense_seq, start=1):
             q = pick_question(tense)
             asked += 1
             if ask_question(q, i, total):
@@ -8,9 +8,15 @@ for practicing conjugations in:
 
 This module provides:
 - VERBS: rich metadata and conjugations for common and irregular verbs
+  (expanded at import from the compact per-verb rows in _VERB_ROWS)
+- PRONOUN_IDX: position of each pronoun in the per-tense form tuples
 - AUX_CONJUGATION: conjugations for auxiliaries 'hebben' and 'zijn' (present and past)
 - SENTENCE_TEMPLATES: sentence templates with blanks and metadata about expected tense
+- TEMPLATES_BY_TENSE: the same templates indexed by tense
 - Helper utilities to compose expected answers for perfect tenses
+- PERFECT_ANSWERS: every accepted perfect-tense phrase, precomputed per (verb, tense, pronoun)
+- FORMS: the expected answer per (verb, tense, pronoun), backing get_finite_form
+- ANSWER_INDEX / check_answer: reverse lookup from an answer to the questions it is correct for
 
 Conventions:
 - Pronoun keys are standardized as:
@@ -32,13 +38,35 @@ Separable verbs:
 
 from __future__ import annotations
 
-from typing import Dict, List, Literal, Optional, TypedDict
+import re
+import sys
+from dataclasses import dataclass, field
+from enum import IntEnum, IntFlag
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Literal, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
 
 
 Pronoun = Literal["ik", "jij/je", "u", "hij/zij/het", "wij/we", "jullie", "zij/ze"]
 TenseCode = Literal["o.t.t.", "o.v.t.", "v.t.t.", "v.v.t."]
 
 PRONOUNS: List[Pronoun] = ["ik", "jij/je", "u", "hij/zij/het", "wij/we", "jullie", "zij/ze"]
+# Interned so every pronoun key below shares one string object (identity-fast dict lookups)
+PRONOUNS[:] = [sys.intern(p) for p in PRONOUNS]  # type: ignore[misc]
+
+
+class PronounIndex(IntEnum):
+    """Position of each pronoun in per-tense form tuples (same order as PRONOUNS)."""
+    IK = 0
+    JIJ = 1
+    U = 2
+    HIJ = 3
+    WIJ = 4
+    JULLIE = 5
+    ZIJ = 6
+
+
+# Index of each pronoun key in the per-tense form tuples, as a PronounIndex member.
+PRONOUN_IDX: Dict[Pronoun, PronounIndex] = dict(zip(PRONOUNS, PronounIndex))
 
 TENSES: Dict[TenseCode, Dict[str, object]] = {
     "o.t.t.": {
@@ -68,22 +96,42 @@ TENSES: Dict[TenseCode, Dict[str, object]] = {
 }
 
 
-class Conjugations(TypedDict):
+# Seven finite forms ordered like PRONOUNS; index with PRONOUN_IDX[pronoun] or PronounIndex
+# (or use get_form for lookups by pronoun key).
+PronounForms = Tuple[str, str, str, str, str, str, str]
+
+
+class Conjugations(NamedTuple):
     # Finite verb forms
-    o_t_t: Dict[Pronoun, str]
-    o_v_t: Dict[Pronoun, str]
+    o_t_t: PronounForms
+    o_v_t: PronounForms
+
 
+class Aux(IntFlag):
+    """Auxiliaries a verb takes in the perfect tenses; BOTH for verbs that allow either."""
+    HEBBEN = 1
+    ZIJN = 2
+    BOTH = 3
 
-class VerbEntry(TypedDict, total=False):
+
+_AUX_BY_NAME: Dict[str, Aux] = {"hebben": Aux.HEBBEN, "zijn": Aux.ZIJN}
+# Display/answer order of the auxiliaries: 'hebben' before 'zijn'.
+_AUX_NAMES: Tuple[Tuple[Aux, str], ...] = ((Aux.HEBBEN, "hebben"), (Aux.ZIJN, "zijn"))
+
+
+@dataclass(slots=True, frozen=True)
+class VerbEntry:
     infinitive: str
     translation: str
-    # Auxiliary for perfect tenses: "hebben" | "zijn" | ["hebben","zijn"]
-    aux: str | List[str]
+    type: Literal["regular", "irregular", "separable"]
+    # Auxiliary for perfect tenses: Aux.HEBBEN | Aux.ZIJN | Aux.BOTH
+    aux: Aux
+    # The auxiliary used for the expected perfect-tense answer
+    preferred_aux: Literal["hebben", "zijn"]
     past_participle: str
     separable_prefix: Optional[str]  # e.g., "op" for "opstaan"
-    type: Literal["regular", "irregular", "separable"]
-    notes: str
     conjugations: Conjugations
+    notes: str = ""
 
 
 AUX_CONJUGATION: Dict[str, Dict[TenseCode, Dict[Pronoun, str]]] = {
@@ -129,1300 +177,300 @@ AUX_CONJUGATION: Dict[str, Dict[TenseCode, Dict[Pronoun, str]]] = {
     },
 }
 
-# Core verbs. This includes common regular and irregular verbs, including some separable ones.
-VERBS: Dict[str, VerbEntry] = {
-    # Regular verbs
-    "werken": {
-        "infinitive": "werken",
-        "translation": "to work",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gewerkt",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "werk",
-                "jij/je": "werkt",
-                "u": "werkt",
-                "hij/zij/het": "werkt",
-                "wij/we": "werken",
-                "jullie": "werken",
-                "zij/ze": "werken",
-            },
-            "o_v_t": {
-                "ik": "werkte",
-                "jij/je": "werkte",
-                "u": "werkte",
-                "hij/zij/het": "werkte",
-                "wij/we": "werkten",
-                "jullie": "werkten",
-                "zij/ze": "werkten",
-            },
-        },
-    },
-    "maken": {
-        "infinitive": "maken",
-        "translation": "to make",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gemaakt",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "maak",
-                "jij/je": "maakt",
-                "u": "maakt",
-                "hij/zij/het": "maakt",
-                "wij/we": "maken",
-                "jullie": "maken",
-                "zij/ze": "maken",
-            },
-            "o_v_t": {
-                "ik": "maakte",
-                "jij/je": "maakte",
-                "u": "maakte",
-                "hij/zij/het": "maakte",
-                "wij/we": "maakten",
-                "jullie": "maakten",
-                "zij/ze": "maakten",
-            },
-        },
-    },
-    "spelen": {
-        "infinitive": "spelen",
-        "translation": "to play",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gespeeld",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "speel",
-                "jij/je": "speelt",
-                "u": "speelt",
-                "hij/zij/het": "speelt",
-                "wij/we": "spelen",
-                "jullie": "spelen",
-                "zij/ze": "spelen",
-            },
-            "o_v_t": {
-                "ik": "speelde",
-                "jij/je": "speelde",
-                "u": "speelde",
-                "hij/zij/het": "speelde",
-                "wij/we": "speelden",
-                "jullie": "speelden",
-                "zij/ze": "speelden",
-            },
-        },
-    },
-    "leren": {
-        "infinitive": "leren",
-        "translation": "to learn/teach",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "geleerd",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "leer",
-                "jij/je": "leert",
-                "u": "leert",
-                "hij/zij/het": "leert",
-                "wij/we": "leren",
-                "jullie": "leren",
-                "zij/ze": "leren",
-            },
-            "o_v_t": {
-                "ik": "leerde",
-                "jij/je": "leerde",
-                "u": "leerde",
-                "hij/zij/het": "leerde",
-                "wij/we": "leerden",
-                "jullie": "leerden",
-                "zij/ze": "leerden",
-            },
-        },
-    },
-    "wonen": {
-        "infinitive": "wonen",
-        "translation": "to live (reside)",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gewoond",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "woon",
-                "jij/je": "woont",
-                "u": "woont",
-                "hij/zij/het": "woont",
-                "wij/we": "wonen",
-                "jullie": "wonen",
-                "zij/ze": "wonen",
-            },
-            "o_v_t": {
-                "ik": "woonde",
-                "jij/je": "woonde",
-                "u": "woonde",
-                "hij/zij/het": "woonde",
-                "wij/we": "woonden",
-                "jullie": "woonden",
-                "zij/ze": "woonden",
-            },
-        },
-    },
-    "praten": {
-        "infinitive": "praten",
-        "translation": "to talk",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gepraat",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "praat",
-                "jij/je": "praat",
-                "u": "praat",
-                "hij/zij/het": "praat",
-                "wij/we": "praten",
-                "jullie": "praten",
-                "zij/ze": "praten",
-            },
-            "o_v_t": {
-                "ik": "praatte",
-                "jij/je": "praatte",
-                "u": "praatte",
-                "hij/zij/het": "praatte",
-                "wij/we": "praatten",
-                "jullie": "praatten",
-                "zij/ze": "praatten",
-            },
-        },
-    },
-    "bellen": {
-        "infinitive": "bellen",
-        "translation": "to call",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gebeld",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "bel",
-                "jij/je": "belt",
-                "u": "belt",
-                "hij/zij/het": "belt",
-                "wij/we": "bellen",
-                "jullie": "bellen",
-                "zij/ze": "bellen",
-            },
-            "o_v_t": {
-                "ik": "belde",
-                "jij/je": "belde",
-                "u": "belde",
-                "hij/zij/het": "belde",
-                "wij/we": "belden",
-                "jullie": "belden",
-                "zij/ze": "belden",
-            },
-        },
-    },
-    "koken": {
-        "infinitive": "koken",
-        "translation": "to cook",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gekookt",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "kook",
-                "jij/je": "kookt",
-                "u": "kookt",
-                "hij/zij/het": "kookt",
-                "wij/we": "koken",
-                "jullie": "koken",
-                "zij/ze": "koken",
-            },
-            "o_v_t": {
-                "ik": "kookte",
-                "jij/je": "kookte",
-                "u": "kookte",
-                "hij/zij/het": "kookte",
-                "wij/we": "kookten",
-                "jullie": "kookten",
-                "zij/ze": "kookten",
-            },
-        },
-    },
-    "studeren": {
-        "infinitive": "studeren",
-        "translation": "to study",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gestudeerd",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "studeer",
-                "jij/je": "studeert",
-                "u": "studeert",
-                "hij/zij/het": "studeert",
-                "wij/we": "studeren",
-                "jullie": "studeren",
-                "zij/ze": "studeren",
-            },
-            "o_v_t": {
-                "ik": "studeerde",
-                "jij/je": "studeerde",
-                "u": "studeerde",
-                "hij/zij/het": "studeerde",
-                "wij/we": "studeerden",
-                "jullie": "studeerden",
-                "zij/ze": "studeerden",
-            },
-        },
-    },
-    "reizen": {
-        "infinitive": "reizen",
-        "translation": "to travel",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gereisd",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "reis",
-                "jij/je": "reist",
-                "u": "reist",
-                "hij/zij/het": "reist",
-                "wij/we": "reizen",
-                "jullie": "reizen",
-                "zij/ze": "reizen",
-            },
-            "o_v_t": {
-                "ik": "reisde",
-                "jij/je": "reisde",
-                "u": "reisde",
-                "hij/zij/het": "reisde",
-                "wij/we": "reisden",
-                "jullie": "reisden",
-                "zij/ze": "reisden",
-            },
-        },
-    },
-    "zetten": {
-        "infinitive": "zetten",
-        "translation": "to put/place",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gezet",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "zet",
-                "jij/je": "zet",
-                "u": "zet",
-                "hij/zij/het": "zet",
-                "wij/we": "zetten",
-                "jullie": "zetten",
-                "zij/ze": "zetten",
-            },
-            "o_v_t": {
-                "ik": "zette",
-                "jij/je": "zette",
-                "u": "zette",
-                "hij/zij/het": "zette",
-                "wij/we": "zetten",
-                "jullie": "zetten",
-                "zij/ze": "zetten",
-            },
-        },
-    },
-    "fietsen": {
-        "infinitive": "fietsen",
-        "translation": "to cycle",
-        "type": "regular",
-        "aux": "hebben",
-        "past_participle": "gefietst",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "fiets",
-                "jij/je": "fietst",
-                "u": "fietst",
-                "hij/zij/het": "fietst",
-                "wij/we": "fietsen",
-                "jullie": "fietsen",
-                "zij/ze": "fietsen",
-            },
-            "o_v_t": {
-                "ik": "fietste",
-                "jij/je": "fietste",
-                "u": "fietste",
-                "hij/zij/het": "fietste",
-                "wij/we": "fietsten",
-                "jullie": "fietsten",
-                "zij/ze": "fietsten",
-            },
-        },
-    },
 
+def _interned(d: dict) -> dict:
+    """
+    Return a copy of a nested dict with every str key and value passed through sys.intern,
+    so repeated strings ("hebben", "zijn", pronoun keys, tense codes) share one object.
+    """
+    return {
+        (sys.intern(k) if isinstance(k, str) else k): (
+            _interned(v) if isinstance(v, dict) else sys.intern(v) if isinstance(v, str) else v
+        )
+        for k, v in d.items()
+    }
+
+
+TENSES = _interned(TENSES)
+AUX_CONJUGATION = _interned(AUX_CONJUGATION)
+
+# (infinitive, translation, type, aux, past_participle, separable_prefix, o.t.t. forms, o.v.t. forms)
+_VerbRow = Tuple[str, str, str, Union[str, Tuple[str, ...]], str, Optional[str], Tuple[str, ...], Tuple[str, ...]]
+
+# Regular verbs: (infinitive, translation, aux, past_participle). Their o.t.t./o.v.t. forms
+# follow the spelling rules in _conjugate_regular, so adding one is a single line.
+_REGULAR_VERBS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("werken", "to work", "hebben", "gewerkt"),
+    ("maken", "to make", "hebben", "gemaakt"),
+    ("spelen", "to play", "hebben", "gespeeld"),
+    ("leren", "to learn/teach", "hebben", "geleerd"),
+    ("wonen", "to live (reside)", "hebben", "gewoond"),
+    ("praten", "to talk", "hebben", "gepraat"),
+    ("bellen", "to call", "hebben", "gebeld"),
+    ("koken", "to cook", "hebben", "gekookt"),
+    ("studeren", "to study", "hebben", "gestudeerd"),
+    ("reizen", "to travel", "hebben", "gereisd"),
+    ("zetten", "to put/place", "hebben", "gezet"),
+    ("fietsen", "to cycle", "hebben", "gefietst"),
+)
+
+# Core irregular verbs, including some separable ones, one compact row per verb with all
+# forms written out; the o.t.t./o.v.t. tuples follow the order of PRONOUNS.
+# `aux` is "hebben", "zijn", or a tuple of both for verbs that take either.
+_IRREGULAR_VERB_ROWS: Tuple[_VerbRow, ...] = (
     # Irregular verbs
-    "zijn": {
-        "infinitive": "zijn",
-        "translation": "to be",
-        "type": "irregular",
-        "aux": "zijn",
-        "past_participle": "geweest",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "ben",
-                "jij/je": "bent",
-                "u": "bent",
-                "hij/zij/het": "is",
-                "wij/we": "zijn",
-                "jullie": "zijn",
-                "zij/ze": "zijn",
-            },
-            "o_v_t": {
-                "ik": "was",
-                "jij/je": "was",
-                "u": "was",
-                "hij/zij/het": "was",
-                "wij/we": "waren",
-                "jullie": "waren",
-                "zij/ze": "waren",
-            },
-        },
-    },
-    "hebben": {
-        "infinitive": "hebben",
-        "translation": "to have",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gehad",
-        "separable_prefix": None,
-        "conjugations": AUX_CONJUGATION["hebben"] | {},  # reuse exact forms
-    },
-    "gaan": {
-        "infinitive": "gaan",
-        "translation": "to go",
-        "type": "irregular",
-        "aux": "zijn",
-        "past_participle": "gegaan",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "ga",
-                "jij/je": "gaat",
-                "u": "gaat",
-                "hij/zij/het": "gaat",
-                "wij/we": "gaan",
-                "jullie": "gaan",
-                "zij/ze": "gaan",
-            },
-            "o_v_t": {
-                "ik": "ging",
-                "jij/je": "ging",
-                "u": "ging",
-                "hij/zij/het": "ging",
-                "wij/we": "gingen",
-                "jullie": "gingen",
-                "zij/ze": "gingen",
-            },
-        },
-    },
-    "komen": {
-        "infinitive": "komen",
-        "translation": "to come",
-        "type": "irregular",
-        "aux": "zijn",
-        "past_participle": "gekomen",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "kom",
-                "jij/je": "komt",
-                "u": "komt",
-                "hij/zij/het": "komt",
-                "wij/we": "komen",
-                "jullie": "komen",
-                "zij/ze": "komen",
-            },
-            "o_v_t": {
-                "ik": "kwam",
-                "jij/je": "kwam",
-                "u": "kwam",
-                "hij/zij/het": "kwam",
-                "wij/we": "kwamen",
-                "jullie": "kwamen",
-                "zij/ze": "kwamen",
-            },
-        },
-    },
-    "blijven": {
-        "infinitive": "blijven",
-        "translation": "to stay",
-        "type": "irregular",
-        "aux": "zijn",
-        "past_participle": "gebleven",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "blijf",
-                "jij/je": "blijft",
-                "u": "blijft",
-                "hij/zij/het": "blijft",
-                "wij/we": "blijven",
-                "jullie": "blijven",
-                "zij/ze": "blijven",
-            },
-            "o_v_t": {
-                "ik": "bleef",
-                "jij/je": "bleef",
-                "u": "bleef",
-                "hij/zij/het": "bleef",
-                "wij/we": "bleven",
-                "jullie": "bleven",
-                "zij/ze": "bleven",
-            },
-        },
-    },
-    "worden": {
-        "infinitive": "worden",
-        "translation": "to become",
-        "type": "irregular",
-        "aux": "zijn",
-        "past_participle": "geworden",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "word",
-                "jij/je": "wordt",
-                "u": "wordt",
-                "hij/zij/het": "wordt",
-                "wij/we": "worden",
-                "jullie": "worden",
-                "zij/ze": "worden",
-            },
-            "o_v_t": {
-                "ik": "werd",
-                "jij/je": "werd",
-                "u": "werd",
-                "hij/zij/het": "werd",
-                "wij/we": "werden",
-                "jullie": "werden",
-                "zij/ze": "werden",
-            },
-        },
-    },
-    "vallen": {
-        "infinitive": "vallen",
-        "translation": "to fall",
-        "type": "irregular",
-        "aux": "zijn",
-        "past_participle": "gevallen",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "val",
-                "jij/je": "valt",
-                "u": "valt",
-                "hij/zij/het": "valt",
-                "wij/we": "vallen",
-                "jullie": "vallen",
-                "zij/ze": "vallen",
-            },
-            "o_v_t": {
-                "ik": "viel",
-                "jij/je": "viel",
-                "u": "viel",
-                "hij/zij/het": "viel",
-                "wij/we": "vielen",
-                "jullie": "vielen",
-                "zij/ze": "vielen",
-            },
-        },
-    },
-    "beginnen": {
-        "infinitive": "beginnen",
-        "translation": "to begin",
-        "type": "irregular",
-        "aux": "zijn",
-        "past_participle": "begonnen",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "begin",
-                "jij/je": "begint",
-                "u": "begint",
-                "hij/zij/het": "begint",
-                "wij/we": "beginnen",
-                "jullie": "beginnen",
-                "zij/ze": "beginnen",
-            },
-            "o_v_t": {
-                "ik": "begon",
-                "jij/je": "begon",
-                "u": "begon",
-                "hij/zij/het": "begon",
-                "wij/we": "begonnen",
-                "jullie": "begonnen",
-                "zij/ze": "begonnen",
-            },
-        },
-    },
-    "lopen": {
-        "infinitive": "lopen",
-        "translation": "to walk",
-        "type": "irregular",
-        "aux": ["hebben", "zijn"],
-        "past_participle": "gelopen",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "loop",
-                "jij/je": "loopt",
-                "u": "loopt",
-                "hij/zij/het": "loopt",
-                "wij/we": "lopen",
-                "jullie": "lopen",
-                "zij/ze": "lopen",
-            },
-            "o_v_t": {
-                "ik": "liep",
-                "jij/je": "liep",
-                "u": "liep",
-                "hij/zij/het": "liep",
-                "wij/we": "liepen",
-                "jullie": "liepen",
-                "zij/ze": "liepen",
-            },
-        },
-    },
-    "rijden": {
-        "infinitive": "rijden",
-        "translation": "to drive/ride",
-        "type": "irregular",
-        "aux": ["hebben", "zijn"],
-        "past_participle": "gereden",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "rijd",
-                "jij/je": "rijdt",
-                "u": "rijdt",
-                "hij/zij/het": "rijdt",
-                "wij/we": "rijden",
-                "jullie": "rijden",
-                "zij/ze": "rijden",
-            },
-            "o_v_t": {
-                "ik": "reed",
-                "jij/je": "reed",
-                "u": "reed",
-                "hij/zij/het": "reed",
-                "wij/we": "reden",
-                "jullie": "reden",
-                "zij/ze": "reden",
-            },
-        },
-    },
-    "kijken": {
-        "infinitive": "kijken",
-        "translation": "to look/watch",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gekeken",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "kijk",
-                "jij/je": "kijkt",
-                "u": "kijkt",
-                "hij/zij/het": "kijkt",
-                "wij/we": "kijken",
-                "jullie": "kijken",
-                "zij/ze": "kijken",
-            },
-            "o_v_t": {
-                "ik": "keek",
-                "jij/je": "keek",
-                "u": "keek",
-                "hij/zij/het": "keek",
-                "wij/we": "keken",
-                "jullie": "keken",
-                "zij/ze": "keken",
-            },
-        },
-    },
-    "kopen": {
-        "infinitive": "kopen",
-        "translation": "to buy",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gekocht",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "koop",
-                "jij/je": "koopt",
-                "u": "koopt",
-                "hij/zij/het": "koopt",
-                "wij/we": "kopen",
-                "jullie": "kopen",
-                "zij/ze": "kopen",
-            },
-            "o_v_t": {
-                "ik": "kocht",
-                "jij/je": "kocht",
-                "u": "kocht",
-                "hij/zij/het": "kocht",
-                "wij/we": "kochten",
-                "jullie": "kochten",
-                "zij/ze": "kochten",
-            },
-        },
-    },
-    "denken": {
-        "infinitive": "denken",
-        "translation": "to think",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gedacht",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "denk",
-                "jij/je": "denkt",
-                "u": "denkt",
-                "hij/zij/het": "denkt",
-                "wij/we": "denken",
-                "jullie": "denken",
-                "zij/ze": "denken",
-            },
-            "o_v_t": {
-                "ik": "dacht",
-                "jij/je": "dacht",
-                "u": "dacht",
-                "hij/zij/het": "dacht",
-                "wij/we": "dachten",
-                "jullie": "dachten",
-                "zij/ze": "dachten",
-            },
-        },
-    },
-    "geven": {
-        "infinitive": "geven",
-        "translation": "to give",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gegeven",
-        "separable_prefix": None,
-        "conjugations": {
-                "o_t_t": {
-                    "ik": "geef",
-                    "jij/je": "geeft",
-                    "u": "geeft",
-                    "hij/zij/het": "geeft",
-                    "wij/we": "geven",
-                    "jullie": "geven",
-                    "zij/ze": "geven",
-                },
-                "o_v_t": {
-                    "ik": "gaf",
-                    "jij/je": "gaf",
-                    "u": "gaf",
-                    "hij/zij/het": "gaf",
-                    "wij/we": "gaven",
-                    "jullie": "gaven",
-                    "zij/ze": "gaven",
-                },
-        },
-    },
-    "zien": {
-        "infinitive": "zien",
-        "translation": "to see",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gezien",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "zie",
-                "jij/je": "ziet",
-                "u": "ziet",
-                "hij/zij/het": "ziet",
-                "wij/we": "zien",
-                "jullie": "zien",
-                "zij/ze": "zien",
-            },
-            "o_v_t": {
-                "ik": "zag",
-                "jij/je": "zag",
-                "u": "zag",
-                "hij/zij/het": "zag",
-                "wij/we": "zagen",
-                "jullie": "zagen",
-                "zij/ze": "zagen",
-            },
-        },
-    },
-    "vinden": {
-        "infinitive": "vinden",
-        "translation": "to find",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gevonden",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "vind",
-                "jij/je": "vindt",
-                "u": "vindt",
-                "hij/zij/het": "vindt",
-                "wij/we": "vinden",
-                "jullie": "vinden",
-                "zij/ze": "vinden",
-            },
-            "o_v_t": {
-                "ik": "vond",
-                "jij/je": "vond",
-                "u": "vond",
-                "hij/zij/het": "vond",
-                "wij/we": "vonden",
-                "jullie": "vonden",
-                "zij/ze": "vonden",
-            },
-        },
-    },
-    "weten": {
-        "infinitive": "weten",
-        "translation": "to know",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "geweten",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "weet",
-                "jij/je": "weet",
-                "u": "weet",
-                "hij/zij/het": "weet",
-                "wij/we": "weten",
-                "jullie": "weten",
-                "zij/ze": "weten",
-            },
-            "o_v_t": {
-                "ik": "wist",
-                "jij/je": "wist",
-                "u": "wist",
-                "hij/zij/het": "wist",
-                "wij/we": "wisten",
-                "jullie": "wisten",
-                "zij/ze": "wisten",
-            },
-        },
-    },
-    "nemen": {
-        "infinitive": "nemen",
-        "translation": "to take",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "genomen",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "neem",
-                "jij/je": "neemt",
-                "u": "neemt",
-                "hij/zij/het": "neemt",
-                "wij/we": "nemen",
-                "jullie": "nemen",
-                "zij/ze": "nemen",
-            },
-            "o_v_t": {
-                "ik": "nam",
-                "jij/je": "nam",
-                "u": "nam",
-                "hij/zij/het": "nam",
-                "wij/we": "namen",
-                "jullie": "namen",
-                "zij/ze": "namen",
-            },
-        },
-    },
-    "drinken": {
-        "infinitive": "drinken",
-        "translation": "to drink",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gedronken",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "drink",
-                "jij/je": "drinkt",
-                "u": "drinkt",
-                "hij/zij/het": "drinkt",
-                "wij/we": "drinken",
-                "jullie": "drinken",
-                "zij/ze": "drinken",
-            },
-            "o_v_t": {
-                "ik": "dronk",
-                "jij/je": "dronk",
-                "u": "dronk",
-                "hij/zij/het": "dronk",
-                "wij/we": "dronken",
-                "jullie": "dronken",
-                "zij/ze": "dronken",
-            },
-        },
-    },
-    "slapen": {
-        "infinitive": "slapen",
-        "translation": "to sleep",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "geslapen",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "slaap",
-                "jij/je": "slaapt",
-                "u": "slaapt",
-                "hij/zij/het": "slaapt",
-                "wij/we": "slapen",
-                "jullie": "slapen",
-                "zij/ze": "slapen",
-            },
-            "o_v_t": {
-                "ik": "sliep",
-                "jij/je": "sliep",
-                "u": "sliep",
-                "hij/zij/het": "sliep",
-                "wij/we": "sliepen",
-                "jullie": "sliepen",
-                "zij/ze": "sliepen",
-            },
-        },
-    },
-    "houden": {
-        "infinitive": "houden",
-        "translation": "to hold/like",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gehouden",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "houd",
-                "jij/je": "houdt",
-                "u": "houdt",
-                "hij/zij/het": "houdt",
-                "wij/we": "houden",
-                "jullie": "houden",
-                "zij/ze": "houden",
-            },
-            "o_v_t": {
-                "ik": "hield",
-                "jij/je": "hield",
-                "u": "hield",
-                "hij/zij/het": "hield",
-                "wij/we": "hielden",
-                "jullie": "hielden",
-                "zij/ze": "hielden",
-            },
-        },
-    },
-    "staan": {
-        "infinitive": "staan",
-        "translation": "to stand",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gestaan",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "sta",
-                "jij/je": "staat",
-                "u": "staat",
-                "hij/zij/het": "staat",
-                "wij/we": "staan",
-                "jullie": "staan",
-                "zij/ze": "staan",
-            },
-            "o_v_t": {
-                "ik": "stond",
-                "jij/je": "stond",
-                "u": "stond",
-                "hij/zij/het": "stond",
-                "wij/we": "stonden",
-                "jullie": "stonden",
-                "zij/ze": "stonden",
-            },
-        },
-    },
-    "lezen": {
-        "infinitive": "lezen",
-        "translation": "to read",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gelezen",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "lees",
-                "jij/je": "leest",
-                "u": "leest",
-                "hij/zij/het": "leest",
-                "wij/we": "lezen",
-                "jullie": "lezen",
-                "zij/ze": "lezen",
-            },
-            "o_v_t": {
-                "ik": "las",
-                "jij/je": "las",
-                "u": "las",
-                "hij/zij/het": "las",
-                "wij/we": "lazen",
-                "jullie": "lazen",
-                "zij/ze": "lazen",
-            },
-        },
-    },
-    "schrijven": {
-        "infinitive": "schrijven",
-        "translation": "to write",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "geschreven",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "schrijf",
-                "jij/je": "schrijft",
-                "u": "schrijft",
-                "hij/zij/het": "schrijft",
-                "wij/we": "schrijven",
-                "jullie": "schrijven",
-                "zij/ze": "schrijven",
-            },
-            "o_v_t": {
-                "ik": "schreef",
-                "jij/je": "schreef",
-                "u": "schreef",
-                "hij/zij/het": "schreef",
-                "wij/we": "schreven",
-                "jullie": "schreven",
-                "zij/ze": "schreven",
-            },
-        },
-    },
-    "spreken": {
-        "infinitive": "spreken",
-        "translation": "to speak",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gesproken",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "spreek",
-                "jij/je": "spreekt",
-                "u": "spreekt",
-                "hij/zij/het": "spreekt",
-                "wij/we": "spreken",
-                "jullie": "spreken",
-                "zij/ze": "spreken",
-            },
-            "o_v_t": {
-                "ik": "sprak",
-                "jij/je": "sprak",
-                "u": "sprak",
-                "hij/zij/het": "sprak",
-                "wij/we": "spraken",
-                "jullie": "spraken",
-                "zij/ze": "spraken",
-            },
-        },
-    },
-    "doen": {
-        "infinitive": "doen",
-        "translation": "to do",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gedaan",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "doe",
-                "jij/je": "doet",
-                "u": "doet",
-                "hij/zij/het": "doet",
-                "wij/we": "doen",
-                "jullie": "doen",
-                "zij/ze": "doen",
-            },
-            "o_v_t": {
-                "ik": "deed",
-                "jij/je": "deed",
-                "u": "deed",
-                "hij/zij/het": "deed",
-                "wij/we": "deden",
-                "jullie": "deden",
-                "zij/ze": "deden",
-            },
-        },
-    },
-    "eten": {
-        "infinitive": "eten",
-        "translation": "to eat",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "gegeten",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "eet",
-                "jij/je": "eet",
-                "u": "eet",
-                "hij/zij/het": "eet",
-                "wij/we": "eten",
-                "jullie": "eten",
-                "zij/ze": "eten",
-            },
-            "o_v_t": {
-                "ik": "at",
-                "jij/je": "at",
-                "u": "at",
-                "hij/zij/het": "at",
-                "wij/we": "aten",
-                "jullie": "aten",
-                "zij/ze": "aten",
-            },
-        },
-    },
-    "helpen": {
-        "infinitive": "helpen",
-        "translation": "to help",
-        "type": "irregular",
-        "aux": "hebben",
-        "past_participle": "geholpen",
-        "separable_prefix": None,
-        "conjugations": {
-            "o_t_t": {
-                "ik": "help",
-                "jij/je": "helpt",
-                "u": "helpt",
-                "hij/zij/het": "helpt",
-                "wij/we": "helpen",
-                "jullie": "helpen",
-                "zij/ze": "helpen",
-            },
-            "o_v_t": {
-                "ik": "hielp",
-                "jij/je": "hielp",
-                "u": "hielp",
-                "hij/zij/het": "hielp",
-                "wij/we": "hielpen",
-                "jullie": "hielpen",
-                "zij/ze": "hielpen",
-            },
-        },
-    },
+    ("zijn", "to be", "irregular", "zijn", "geweest", None,
+     ("ben", "bent", "bent", "is", "zijn", "zijn", "zijn"),
+     ("was", "was", "was", "was", "waren", "waren", "waren")),
+    ("hebben", "to have", "irregular", "hebben", "gehad", None,
+     ("heb", "hebt", "heeft", "heeft", "hebben", "hebben", "hebben"),
+     ("had", "had", "had", "had", "hadden", "hadden", "hadden")),
+    ("gaan", "to go", "irregular", "zijn", "gegaan", None,
+     ("ga", "gaat", "gaat", "gaat", "gaan", "gaan", "gaan"),
+     ("ging", "ging", "ging", "ging", "gingen", "gingen", "gingen")),
+    ("komen", "to come", "irregular", "zijn", "gekomen", None,
+     ("kom", "komt", "komt", "komt", "komen", "komen", "komen"),
+     ("kwam", "kwam", "kwam", "kwam", "kwamen", "kwamen", "kwamen")),
+    ("blijven", "to stay", "irregular", "zijn", "gebleven", None,
+     ("blijf", "blijft", "blijft", "blijft", "blijven", "blijven", "blijven"),
+     ("bleef", "bleef", "bleef", "bleef", "bleven", "bleven", "bleven")),
+    ("worden", "to become", "irregular", "zijn", "geworden", None,
+     ("word", "wordt", "wordt", "wordt", "worden", "worden", "worden"),
+     ("werd", "werd", "werd", "werd", "werden", "werden", "werden")),
+    ("vallen", "to fall", "irregular", "zijn", "gevallen", None,
+     ("val", "valt", "valt", "valt", "vallen", "vallen", "vallen"),
+     ("viel", "viel", "viel", "viel", "vielen", "vielen", "vielen")),
+    ("beginnen", "to begin", "irregular", "zijn", "begonnen", None,
+     ("begin", "begint", "begint", "begint", "beginnen", "beginnen", "beginnen"),
+     ("begon", "begon", "begon", "begon", "begonnen", "begonnen", "begonnen")),
+    ("lopen", "to walk", "irregular", ("hebben", "zijn"), "gelopen", None,
+     ("loop", "loopt", "loopt", "loopt", "lopen", "lopen", "lopen"),
+     ("liep", "liep", "liep", "liep", "liepen", "liepen", "liepen")),
+    ("rijden", "to drive/ride", "irregular", ("hebben", "zijn"), "gereden", None,
+     ("rijd", "rijdt", "rijdt", "rijdt", "rijden", "rijden", "rijden"),
+     ("reed", "reed", "reed", "reed", "reden", "reden", "reden")),
+    ("kijken", "to look/watch", "irregular", "hebben", "gekeken", None,
+     ("kijk", "kijkt", "kijkt", "kijkt", "kijken", "kijken", "kijken"),
+     ("keek", "keek", "keek", "keek", "keken", "keken", "keken")),
+    ("kopen", "to buy", "irregular", "hebben", "gekocht", None,
+     ("koop", "koopt", "koopt", "koopt", "kopen", "kopen", "kopen"),
+     ("kocht", "kocht", "kocht", "kocht", "kochten", "kochten", "kochten")),
+    ("denken", "to think", "irregular", "hebben", "gedacht", None,
+     ("denk", "denkt", "denkt", "denkt", "denken", "denken", "denken"),
+     ("dacht", "dacht", "dacht", "dacht", "dachten", "dachten", "dachten")),
+    ("geven", "to give", "irregular", "hebben", "gegeven", None,
+     ("geef", "geeft", "geeft", "geeft", "geven", "geven", "geven"),
+     ("gaf", "gaf", "gaf", "gaf", "gaven", "gaven", "gaven")),
+    ("zien", "to see", "irregular", "hebben", "gezien", None,
+     ("zie", "ziet", "ziet", "ziet", "zien", "zien", "zien"),
+     ("zag", "zag", "zag", "zag", "zagen", "zagen", "zagen")),
+    ("vinden", "to find", "irregular", "hebben", "gevonden", None,
+     ("vind", "vindt", "vindt", "vindt", "vinden", "vinden", "vinden"),
+     ("vond", "vond", "vond", "vond", "vonden", "vonden", "vonden")),
+    ("weten", "to know", "irregular", "hebben", "geweten", None,
+     ("weet", "weet", "weet", "weet", "weten", "weten", "weten"),
+     ("wist", "wist", "wist", "wist", "wisten", "wisten", "wisten")),
+    ("nemen", "to take", "irregular", "hebben", "genomen", None,
+     ("neem", "neemt", "neemt", "neemt", "nemen", "nemen", "nemen"),
+     ("nam", "nam", "nam", "nam", "namen", "namen", "namen")),
+    ("drinken", "to drink", "irregular", "hebben", "gedronken", None,
+     ("drink", "drinkt", "drinkt", "drinkt", "drinken", "drinken", "drinken"),
+     ("dronk", "dronk", "dronk", "dronk", "dronken", "dronken", "dronken")),
+    ("slapen", "to sleep", "irregular", "hebben", "geslapen", None,
+     ("slaap", "slaapt", "slaapt", "slaapt", "slapen", "slapen", "slapen"),
+     ("sliep", "sliep", "sliep", "sliep", "sliepen", "sliepen", "sliepen")),
+    ("houden", "to hold/like", "irregular", "hebben", "gehouden", None,
+     ("houd", "houdt", "houdt", "houdt", "houden", "houden", "houden"),
+     ("hield", "hield", "hield", "hield", "hielden", "hielden", "hielden")),
+    ("staan", "to stand", "irregular", "hebben", "gestaan", None,
+     ("sta", "staat", "staat", "staat", "staan", "staan", "staan"),
+     ("stond", "stond", "stond", "stond", "stonden", "stonden", "stonden")),
+    ("lezen", "to read", "irregular", "hebben", "gelezen", None,
+     ("lees", "leest", "leest", "leest", "lezen", "lezen", "lezen"),
+     ("las", "las", "las", "las", "lazen", "lazen", "lazen")),
+    ("schrijven", "to write", "irregular", "hebben", "geschreven", None,
+     ("schrijf", "schrijft", "schrijft", "schrijft", "schrijven", "schrijven", "schrijven"),
+     ("schreef", "schreef", "schreef", "schreef", "schreven", "schreven", "schreven")),
+    ("spreken", "to speak", "irregular", "hebben", "gesproken", None,
+     ("spreek", "spreekt", "spreekt", "spreekt", "spreken", "spreken", "spreken"),
+     ("sprak", "sprak", "sprak", "sprak", "spraken", "spraken", "spraken")),
+    ("doen", "to do", "irregular", "hebben", "gedaan", None,
+     ("doe", "doet", "doet", "doet", "doen", "doen", "doen"),
+     ("deed", "deed", "deed", "deed", "deden", "deden", "deden")),
+    ("eten", "to eat", "irregular", "hebben", "gegeten", None,
+     ("eet", "eet", "eet", "eet", "eten", "eten", "eten"),
+     ("at", "at", "at", "at", "aten", "aten", "aten")),
+    ("helpen", "to help", "irregular", "hebben", "geholpen", None,
+     ("help", "helpt", "helpt", "helpt", "helpen", "helpen", "helpen"),
+     ("hielp", "hielp", "hielp", "hielp", "hielpen", "hielpen", "hielpen")),
 
     # Separable verbs
-    "opstaan": {
-        "infinitive": "opstaan",
-        "translation": "to get up",
-        "type": "separable",
-        "aux": "zijn",
-        "past_participle": "opgestaan",
-        "separable_prefix": "op",
-        "conjugations": {
-            "o_t_t": {
-                "ik": "sta",
-                "jij/je": "staat",
-                "u": "staat",
-                "hij/zij/het": "staat",
-                "wij/we": "staan",
-                "jullie": "staan",
-                "zij/ze": "staan",
-            },
-            "o_v_t": {
-                "ik": "stond",
-                "jij/je": "stond",
-                "u": "stond",
-                "hij/zij/het": "stond",
-                "wij/we": "stonden",
-                "jullie": "stonden",
-                "zij/ze": "stonden",
-            },
-        },
-    },
-    "afwassen": {
-        "infinitive": "afwassen",
-        "translation": "to do the dishes",
-        "type": "separable",
-        "aux": "hebben",
-        "past_participle": "afgewassen",
-        "separable_prefix": "af",
-        "conjugations": {
-            "o_t_t": {
-                "ik": "was",
-                "jij/je": "wast",
-                "u": "wast",
-                "hij/zij/het": "wast",
-                "wij/we": "wassen",
-                "jullie": "wassen",
-                "zij/ze": "wassen",
-            },
-            "o_v_t": {
-                "ik": "waste",
-                "jij/je": "waste",
-                "u": "waste",
-                "hij/zij/het": "waste",
-                "wij/we": "wasten",
-                "jullie": "wasten",
-                "zij/ze": "wasten",
-            },
-        },
-    },
-    "opbellen": {
-        "infinitive": "opbellen",
-        "translation": "to call (on the phone)",
-        "type": "separable",
-        "aux": "hebben",
-        "past_participle": "opgebeld",
-        "separable_prefix": "op",
-        "conjugations": {
-            "o_t_t": {
-                "ik": "bel",
-                "jij/je": "belt",
-                "u": "belt",
-                "hij/zij/het": "belt",
-                "wij/we": "bellen",
-                "jullie": "bellen",
-                "zij/ze": "bellen",
-            },
-            "o_v_t": {
-                "ik": "belde",
-                "jij/je": "belde",
-                "u": "belde",
-                "hij/zij/het": "belde",
-                "wij/we": "belden",
-                "jullie": "belden",
-                "zij/ze": "belden",
-            },
-        },
-    },
-    "terugkomen": {
-        "infinitive": "terugkomen",
-        "translation": "to come back",
-        "type": "separable",
-        "aux": "zijn",
-        "past_participle": "teruggekomen",
-        "separable_prefix": "terug",
-        "conjugations": {
-            "o_t_t": {
-                "ik": "kom",
-                "jij/je": "komt",
-                "u": "komt",
-                "hij/zij/het": "komt",
-                "wij/we": "komen",
-                "jullie": "komen",
-                "zij/ze": "komen",
-            },
-            "o_v_t": {
-                "ik": "kwam",
-                "jij/je": "kwam",
-                "u": "kwam",
-                "hij/zij/het": "kwam",
-                "wij/we": "kwamen",
-                "jullie": "kwamen",
-                "zij/ze": "kwamen",
-            },
-        },
-    },
-    "meenemen": {
-        "infinitive": "meenemen",
-        "translation": "to take along",
-        "type": "separable",
-        "aux": "hebben",
-        "past_participle": "meegenomen",
-        "separable_prefix": "mee",
-        "conjugations": {
-            "o_t_t": {
-                "ik": "neem",
-                "jij/je": "neemt",
-                "u": "neemt",
-                "hij/zij/het": "neemt",
-                "wij/we": "nemen",
-                "jullie": "nemen",
-                "zij/ze": "nemen",
-            },
-            "o_v_t": {
-                "ik": "nam",
-                "jij/je": "nam",
-                "u": "nam",
-                "hij/zij/het": "nam",
-                "wij/we": "namen",
-                "jullie": "namen",
-                "zij/ze": "namen",
-            },
-        },
-    },
-    "meebrengen": {
-        "infinitive": "meebrengen",
-        "translation": "to bring along",
-        "type": "separable",
-        "aux": "hebben",
-        "past_participle": "meegebracht",
-        "separable_prefix": "mee",
-        "conjugations": {
-            "o_t_t": {
-                "ik": "breng",
-                "jij/je": "brengt",
-                "u": "brengt",
-                "hij/zij/het": "brengt",
-                "wij/we": "brengen",
-                "jullie": "brengen",
-                "zij/ze": "brengen",
-            },
-            "o_v_t": {
-                "ik": "bracht",
-                "jij/je": "bracht",
-                "u": "bracht",
-                "hij/zij/het": "bracht",
-                "wij/we": "brachten",
-                "jullie": "brachten",
-                "zij/ze": "brachten",
-            },
-        },
-    },
+    ("opstaan", "to get up", "separable", "zijn", "opgestaan", "op",
+     ("sta", "staat", "staat", "staat", "staan", "staan", "staan"),
+     ("stond", "stond", "stond", "stond", "stonden", "stonden", "stonden")),
+    ("afwassen", "to do the dishes", "separable", "hebben", "afgewassen", "af",
+     ("was", "wast", "wast", "wast", "wassen", "wassen", "wassen"),
+     ("waste", "waste", "waste", "waste", "wasten", "wasten", "wasten")),
+    ("opbellen", "to call (on the phone)", "separable", "hebben", "opgebeld", "op",
+     ("bel", "belt", "belt", "belt", "bellen", "bellen", "bellen"),
+     ("belde", "belde", "belde", "belde", "belden", "belden", "belden")),
+    ("terugkomen", "to come back", "separable", "zijn", "teruggekomen", "terug",
+     ("kom", "komt", "komt", "komt", "komen", "komen", "komen"),
+     ("kwam", "kwam", "kwam", "kwam", "kwamen", "kwamen", "kwamen")),
+    ("meenemen", "to take along", "separable", "hebben", "meegenomen", "mee",
+     ("neem", "neemt", "neemt", "neemt", "nemen", "nemen", "nemen"),
+     ("nam", "nam", "nam", "nam", "namen", "namen", "namen")),
+    ("meebrengen", "to bring along", "separable", "hebben", "meegebracht", "mee",
+     ("breng", "brengt", "brengt", "brengt", "brengen", "brengen", "brengen"),
+     ("bracht", "bracht", "bracht", "bracht", "brachten", "brachten", "brachten")),
+)
+
+_VOWELS = "aeiou"
+
+
+def _conjugate_regular(infinitive: str) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Derive the o.t.t. and o.v.t. forms (ordered like PRONOUNS) of a regular verb:
+    - stem: infinitive minus "-en"; a doubled consonant is reduced (bellen -> bel), the vowel
+      of an open syllable is doubled (maken -> maak) and a final z/v becomes s/f (reizen -> reis)
+    - o.t.t.: stem / stem + "t" (no extra "t" after a stem ending in "t") / infinitive
+    - o.v.t.: stem + "te(n)" after a voiceless consonant ('t kofschip), otherwise stem + "de(n)"
+    """
+    stem = infinitive[:-2]
+    if len(stem) >= 2 and stem[-1] == stem[-2] and stem[-1] not in _VOWELS:
+        stem = stem[:-1]
+    elif len(stem) >= 3 and stem[-1] not in _VOWELS and stem[-2] in _VOWELS and stem[-3] not in _VOWELS:
+        stem = stem[:-1] + stem[-2] + stem[-1]
+    # 't kofschip looks at the consonant before devoicing: reizen -> reisde
+    voiceless = stem[-1] in "tkfspx" or stem.endswith("ch")
+    stem = stem[:-1] + {"z": "s", "v": "f"}.get(stem[-1], stem[-1])
+
+    singular = stem if stem.endswith("t") else stem + "t"
+    past = stem + ("te" if voiceless else "de")
+    ott = (stem, singular, singular, singular, infinitive, infinitive, infinitive)
+    ovt = (past,) * 4 + (past + "n",) * 3
+    return ott, ovt
+
+
+_VERB_ROWS: Tuple[_VerbRow, ...] = tuple(
+    (infinitive, translation, "regular", aux, past_participle, None, *_conjugate_regular(infinitive))
+    for infinitive, translation, aux, past_participle in _REGULAR_VERBS
+) + _IRREGULAR_VERB_ROWS
+
+
+def _pooled_forms(forms: Tuple[str, ...], pool: Dict[Tuple[str, ...], PronounForms]) -> PronounForms:
+    """
+    Return the canonical interned tuple for a row of forms, adding it to `pool` on first use.
+    """
+    pooled = pool.get(forms)
+    if pooled is None:
+        pooled = pool[forms] = tuple(map(sys.intern, forms))  # type: ignore[assignment]
+    return pooled
+
+
+# Dual-auxiliary verbs that take 'zijn' by default (motion/state change).
+_ZIJN_PREFERRED: FrozenSet[str] = frozenset({
+    "gaan", "komen", "blijven", "worden", "vallen",
+    "beginnen", "opstaan", "terugkomen",
+})
+
+
+def _resolve_aux(infinitive: str, aux: Aux) -> Literal["hebben", "zijn"]:
+    """
+    Pick the auxiliary used for a verb's expected perfect-tense answer.
+    If the verb allows both auxiliaries, defaults to 'hebben' (neutral) unless the verb is a canonical
+    zijn-verb (e.g., komen/gaan/blijven/worden/vallen/beginnen/opstaan/terugkomen) where 'zijn' is preferred.
+    """
+    if aux is Aux.HEBBEN:
+        return "hebben"
+    if aux is Aux.ZIJN:
+        return "zijn"
+    # Heuristic: prefer 'zijn' for typical motion/state-change verbs
+    if infinitive in _ZIJN_PREFERRED:
+        return "zijn"
+    # Otherwise default to 'hebben'
+    return "hebben"
+
+
+def _build_entry(row: _VerbRow, forms_pool: Dict[Tuple[str, ...], PronounForms]) -> VerbEntry:
+    """
+    Expand a compact verb row into the frozen VerbEntry exposed via VERBS.
+    """
+    infinitive, translation, verb_type, aux, past_participle, separable_prefix, ott, ovt = row
+    aux_flag = Aux(0)
+    for name in (aux,) if isinstance(aux, str) else aux:
+        aux_flag |= _AUX_BY_NAME[name]
+    return VerbEntry(
+        infinitive=sys.intern(infinitive),
+        translation=translation,
+        type=sys.intern(verb_type),  # type: ignore[arg-type]
+        aux=aux_flag,
+        preferred_aux=_resolve_aux(infinitive, aux_flag),
+        past_participle=sys.intern(past_participle),
+        separable_prefix=sys.intern(separable_prefix) if separable_prefix else separable_prefix,
+        conjugations=Conjugations(_pooled_forms(ott, forms_pool), _pooled_forms(ovt, forms_pool)),
+    )
+
+
+def _build_verbs() -> Dict[str, VerbEntry]:
+    """
+    Expand _VERB_ROWS into VerbEntries. Separable verbs repeat the rows of their base verb
+    (opbellen/bellen, meenemen/nemen, ...), so identical rows share one tuple.
+    """
+    forms_pool: Dict[Tuple[str, ...], PronounForms] = {}
+    return {sys.intern(row[0]): _build_entry(row, forms_pool) for row in _VERB_ROWS}
+
+
+# Read-only: VERBS and its entries are static data and must not be mutated by callers.
+VERBS: Mapping[str, VerbEntry] = MappingProxyType(_build_verbs())
+
+
+def _auxes(entry: VerbEntry) -> Tuple[str, ...]:
+    aux = entry.aux
+    return tuple(name for flag, name in _AUX_NAMES if aux & flag)
+
+
+# Every accepted perfect-tense phrase per (infinitive, tense, pronoun): one
+# "<aux> <past_participle>" per auxiliary the verb allows, 'hebben' first.
+# Built once at import so answers never have to be composed per question.
+PERFECT_ANSWERS: Dict[Tuple[str, TenseCode, Pronoun], Tuple[str, ...]] = {
+    (inf, tense, pron): tuple(
+        sys.intern(f"{AUX_CONJUGATION[aux][info['aux_time']][pron]} {entry.past_participle}")  # type: ignore[index]
+        for aux in _auxes(entry)
+    )
+    for inf, entry in VERBS.items()
+    for tense, info in TENSES.items()
+    if info["is_perfect"]
+    for pron in PRONOUNS
 }
 
-ALL_VERBS: List[str] = sorted(VERBS.keys())
+# Alphabetical and immutable, so callers can share it without defensive copies.
+ALL_VERBS: Tuple[str, ...] = tuple(sorted(VERBS))
 
 
-class Template(TypedDict, total=False):
+@dataclass(slots=True, frozen=True)
+class Template:
     id: str
     template: str  # sentence with a single "____" blank for the verb/verb phrase
     tense: TenseCode
     pronoun: Pronoun
-    # If provided, limit the verb choices to these infinitives (for thematic/natural fit)
-    allowed_verbs: List[str]
+    # If non-empty, limit the verb choices to these infinitives (for thematic/natural fit)
+    allowed_verbs: Tuple[str, ...] = ()
     # Optional hint shown alongside the prompt (e.g., "ovt", "vvt")
-    hint: str
-    notes: str
+    hint: str = ""
+    notes: str = ""
+    # (text before, text after) the "____" blank, split once for render_template
+    _parts: Tuple[str, str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        if self.template.count("____") != 1:
+            raise ValueError(f"Template {self.id!r} must contain exactly one '____' blank")
+        prefix, _, suffix = self.template.partition("____")
+        object.__setattr__(self, "_parts", (prefix, suffix))
 
-SENTENCE_TEMPLATES: List[Template] = [
+
+# One row per template, keyword arguments for Template; expanded into SENTENCE_TEMPLATES below.
+_TEMPLATE_ROWS: List[Dict[str, Union[str, List[str]]]] = [
     # Present (o.t.t.)
     {"id": "ott_1", "template": "Ik ____ elke dag om acht uur.", "tense": "o.t.t.", "pronoun": "ik", "allowed_verbs": ["opstaan"], "hint": "o.t.t.", "notes": "Separable: opstaan -> particle at end for o.t.t."},
     {"id": "ott_1b", "template": "Ik ____ elke dag om acht uur op.", "tense": "o.t.t.", "pronoun": "ik", "allowed_verbs": ["opstaan"], "hint": "o.t.t."},
@@ -1437,17 +485,17 @@ SENTENCE_TEMPLATES: List[Template] = [
     {"id": "ott_9", "template": "Hij ____ snel naar het station.", "tense": "o.t.t.", "pronoun": "hij/zij/het", "allowed_verbs": ["lopen", "rijden", "gaan", "fietsen"], "hint": "o.t.t."},
     {"id": "ott_10", "template": "Wij ____ het boek samen.", "tense": "o.t.t.", "pronoun": "wij/we", "allowed_verbs": ["lezen"], "hint": "o.t.t."},
     {"id": "ott_11", "template": "Zij ____ elke dag om zes uur.", "tense": "o.t.t.", "pronoun": "zij/ze", "allowed_verbs": ["komen", "opstaan"], "hint": "o.t.t."},
-    {"id": "ott_12", "template": "Ik ____ mijn vrienden in het weekend.", "tense": "o.t.t.", "pronoun": "ik", "allowed_verbs": ["bellen", "opbellen", "bezoeken" if False else "bellen"], "hint": "o.t.t.", "notes": "Gebruik opbellen voor separable variant."},
+    {"id": "ott_12", "template": "Ik ____ mijn vrienden in het weekend.", "tense": "o.t.t.", "pronoun": "ik", "allowed_verbs": ["bellen", "opbellen"], "hint": "o.t.t.", "notes": "Gebruik opbellen voor separable variant."},
     {"id": "ott_13", "template": "Jullie ____ altijd op tijd.", "tense": "o.t.t.", "pronoun": "jullie", "allowed_verbs": ["komen", "zijn"], "hint": "o.t.t."},
 
     # Simple past (o.v.t.)
     {"id": "ovt_1", "template": "Gisteren ____ ik naar het park.", "tense": "o.v.t.", "pronoun": "ik", "allowed_verbs": ["lopen", "gaan", "fietsen", "rijden"], "hint": "o.v.t."},
-    {"id": "ovt_2", "template": "Vorige week ____ hij een auto.", "tense": "o.v.t.", "pronoun": "hij/zij/het", "allowed_verbs": ["kopen", "verkopen" if False else "kopen"], "hint": "o.v.t."},
+    {"id": "ovt_2", "template": "Vorige week ____ hij een auto.", "tense": "o.v.t.", "pronoun": "hij/zij/het", "allowed_verbs": ["kopen"], "hint": "o.v.t."},
     {"id": "ovt_3", "template": "Toen ____ wij in Utrecht.", "tense": "o.v.t.", "pronoun": "wij/we", "allowed_verbs": ["wonen"], "hint": "o.v.t."},
     {"id": "ovt_4", "template": "Gisteren ____ jullie de afwas.", "tense": "o.v.t.", "pronoun": "jullie", "allowed_verbs": ["doen", "afwassen"], "hint": "o.v.t."},
     {"id": "ovt_4b", "template": "Gisteren ____ jullie de afwas af.", "tense": "o.v.t.", "pronoun": "jullie", "allowed_verbs": ["afwassen"], "hint": "o.v.t."},
-    {"id": "ovt_5", "template": "Vorig jaar ____ zij naar Nederland.", "tense": "o.v.t.", "pronoun": "zij/ze", "allowed_verbs": ["komen", "verhuizen" if False else "komen"], "hint": "o.v.t."},
-    {"id": "ovt_6", "template": "Eerder ____ ik weinig Nederlands.", "tense": "o.v.t.", "pronoun": "ik", "allowed_verbs": ["weten", "spreken", "verstaan" if False else "spreken"], "hint": "o.v.t."},
+    {"id": "ovt_5", "template": "Vorig jaar ____ zij naar Nederland.", "tense": "o.v.t.", "pronoun": "zij/ze", "allowed_verbs": ["komen"], "hint": "o.v.t."},
+    {"id": "ovt_6", "template": "Eerder ____ ik weinig Nederlands.", "tense": "o.v.t.", "pronoun": "ik", "allowed_verbs": ["weten", "spreken"], "hint": "o.v.t."},
     {"id": "ovt_7", "template": "Vanochtend ____ hij vroeg op.", "tense": "o.v.t.", "pronoun": "hij/zij/het", "allowed_verbs": ["opstaan"], "hint": "o.v.t."},
     {"id": "ovt_8", "template": "Gisteravond ____ we tot laat door.", "tense": "o.v.t.", "pronoun": "wij/we", "allowed_verbs": ["werken", "studeren"], "hint": "o.v.t."},
 
@@ -1475,61 +523,197 @@ SENTENCE_TEMPLATES: List[Template] = [
 ]
 
 
+def _build_templates(rows: List[Dict[str, Union[str, List[str]]]]) -> List[Template]:
+    """
+    Expand template rows into frozen Templates. Each row is a dict of Template keyword arguments
+    ("id", "template", "tense", "pronoun", optional "allowed_verbs" list, "hint", "notes").
+    Tense/pronoun keys are interned (so FORMS/TENSES lookups with them hit the identity fast
+    path) and each allowed_verbs list becomes a tuple shared by all templates with the same verbs.
+    """
+    verbs_pool: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+    templates: List[Template] = []
+    for row in rows:
+        verbs = tuple(sys.intern(v) for v in row.get("allowed_verbs", ()))
+        templates.append(Template(**{  # type: ignore[arg-type]
+            **row,
+            "tense": sys.intern(row["tense"]),  # type: ignore[arg-type]
+            "pronoun": sys.intern(row["pronoun"]),  # type: ignore[arg-type]
+            "allowed_verbs": verbs_pool.setdefault(verbs, verbs),
+        }))
+    return templates
+
+
+SENTENCE_TEMPLATES: List[Template] = _build_templates(_TEMPLATE_ROWS)
+del _TEMPLATE_ROWS
+
+
+def _validate() -> None:
+    """
+    Check the static data once at import, so lookups need no per-call guards.
+    Raises ValueError on the first inconsistency.
+    """
+    if len(PRONOUN_IDX) != len(PRONOUNS) or len(PronounIndex) != len(PRONOUNS):
+        raise ValueError("PronounIndex must list exactly one member per entry of PRONOUNS")
+    for inf, entry in VERBS.items():
+        for tense_key, forms in zip(entry.conjugations._fields, entry.conjugations):
+            if len(forms) != len(PRONOUNS):
+                raise ValueError(f"Verb {inf!r} has {len(forms)} {tense_key} forms, expected {len(PRONOUNS)}")
+    seen_ids = set()
+    for t in SENTENCE_TEMPLATES:
+        tid = t.id
+        if tid in seen_ids:
+            raise ValueError(f"Duplicate template id {tid!r}")
+        seen_ids.add(tid)
+        if t.tense not in TENSES:
+            raise ValueError(f"Template {tid!r} has unknown tense {t.tense!r}")
+        if t.pronoun not in PRONOUN_IDX:
+            raise ValueError(f"Template {tid!r} has unknown pronoun {t.pronoun!r}")
+        for v in t.allowed_verbs:
+            if v not in VERBS:
+                raise ValueError(f"Template {tid!r} allows unknown verb {v!r}")
+
+
+_validate()
+
+
+def _build_templates_by_tense() -> Dict[TenseCode, Tuple[Template, ...]]:
+    """
+    Bucket SENTENCE_TEMPLATES by tense in a single pass (in list order); every tense gets a bucket.
+    """
+    by_tense: Dict[TenseCode, List[Template]] = {t: [] for t in TENSES}  # type: ignore[misc]
+    for t in SENTENCE_TEMPLATES:
+        by_tense[t.tense].append(t)
+    return {tense: tuple(ts) for tense, ts in by_tense.items()}
+
+
+TEMPLATES_BY_TENSE: Dict[TenseCode, Tuple[Template, ...]] = _build_templates_by_tense()
+
+
 def get_finite_form(infinitive: str, tense: TenseCode, pronoun: Pronoun) -> str:
     """
     Return the expected finite form for o.t.t./o.v.t. or the full verb phrase for v.t.t./v.v.t.
     For perfect tenses, returns "<aux> <past_participle>" using the correct auxiliary and its conjugation.
     """
-    if infinitive not in VERBS:
-        raise KeyError(f"Unknown verb: {infinitive}")
-    entry = VERBS[infinitive]
-    if tense in ("o.t.t.", "o.v.t."):
-        key = "o_t_t" if tense == "o.t.t." else "o_v_t"
-        return entry["conjugations"][key][pronoun]
-    # Perfect tenses
-    aux_time = TENSES[tense]["aux_time"]  # type: ignore
-    assert aux_time in ("o.t.t.", "o.v.t.")
-    aux_used = _pick_aux(entry)
-    aux_form = AUX_CONJUGATION[aux_used][aux_time][pronoun]  # type: ignore[index]
-    return f"{aux_form} {entry['past_participle']}"
-
-
-def _pick_aux(entry: VerbEntry) -> str:
+    try:
+        return FORMS[(infinitive, tense, pronoun)]
+    except KeyError:
+        if infinitive not in VERBS:
+            raise KeyError(f"Unknown verb: {infinitive}") from None
+        raise
+
+
+# Position of each finite tense in Conjugations.
+_CONJ_POS: Dict[TenseCode, int] = {"o.t.t.": 0, "o.v.t.": 1}
+
+
+def get_form(infinitive: str, tense: TenseCode, pronoun: Pronoun) -> str:
     """
-    Pick an auxiliary for perfect tenses.
-    If the entry lists multiple auxiliaries, defaults to 'hebben' (neutral) unless the verb is a canonical
-    zijn-verb (e.g., komen/gaan/blijven/worden/vallen/beginnen/opstaan/terugkomen) where 'zijn' is preferred.
+    Return the finite o.t.t./o.v.t. form of a verb from its conjugation rows.
     """
-    aux = entry["aux"]
-    if isinstance(aux, str):
-        return aux
-    # Heuristic: prefer 'zijn' for typical motion/state-change verbs
-    prefer_zijn = entry["aux"] and "zijn" in entry["aux"] and entry["infinitive"] in {
-        "gaan", "komen", "blijven", "worden", "vallen",
-        "beginnen", "opstaan", "terugkomen",
-    }
-    if prefer_zijn:
-        return "zijn"
-    # Otherwise default to 'hebben'
-    return "hebben"
+    return VERBS[infinitive].conjugations[_CONJ_POS[tense]][PRONOUN_IDX[pronoun]]
+
+
+def _build_forms() -> Dict[Tuple[str, TenseCode, Pronoun], str]:
+    """
+    Materialize get_finite_form for every (infinitive, tense, pronoun); the preferred
+    auxiliary of a verb is resolved once, not per pronoun.
+    """
+    forms: Dict[Tuple[str, TenseCode, Pronoun], str] = {}
+    for inf, entry in VERBS.items():
+        aux_pos = _auxes(entry).index(entry.preferred_aux)
+        for tense, info in TENSES.items():
+            for pron in PRONOUNS:
+                key = (inf, tense, pron)
+                if info["is_perfect"]:
+                    forms[key] = PERFECT_ANSWERS[key][aux_pos]  # type: ignore[index]
+                else:
+                    forms[key] = get_form(inf, tense, pron)  # type: ignore[arg-type]
+    return forms
+
+
+# The answer get_finite_form gives for every (infinitive, tense, pronoun); one dict hit per call.
+FORMS: Dict[Tuple[str, TenseCode, Pronoun], str] = _build_forms()
+
+
+def list_templates_for_tense(tense: TenseCode) -> Tuple[Template, ...]:
+    return TEMPLATES_BY_TENSE.get(tense, ())
+
+
+def render_template(t: Template, form: str) -> str:
+    """
+    Return the template sentence with its blank filled in by `form`.
+    """
+    prefix, suffix = t._parts
+    return prefix + form + suffix
+
+
+def list_verbs_for_template(t: Template) -> Sequence[str]:
+    return t.allowed_verbs or ALL_VERBS
 
 
-def list_templates_for_tense(tense: TenseCode) -> List[Template]:
-    return [t for t in SENTENCE_TEMPLATES if t["tense"] == tense]
+# Trailing punctuation and whitespace pattern for normalize_answer (compiled once)
+_END_PUNCT = ".,;:!?"
+_WS_RE = re.compile(r"\s+")
 
 
-def list_verbs_for_template(t: Template) -> List[str]:
-    return t.get("allowed_verbs", ALL_VERBS)
+def normalize_answer(s: str) -> str:
+    """
+    Normalize an answer for comparison: lowercase, trim, collapse whitespace and
+    drop simple trailing punctuation.
+    """
+    s = s.strip().lower().rstrip(_END_PUNCT)
+    return _WS_RE.sub(" ", s)
+
+
+def _build_answer_index() -> Dict[str, FrozenSet[Tuple[str, TenseCode, Pronoun]]]:
+    """
+    Map every accepted answer (normalized) to the (infinitive, tense, pronoun) questions it answers.
+    For perfect tenses every allowed auxiliary counts, matching PERFECT_ANSWERS.
+    """
+    index: Dict[str, set] = {}
+    for inf in VERBS:
+        for tense in TENSES:
+            for pron in PRONOUNS:
+                if tense in ("o.t.t.", "o.v.t."):
+                    answers: Tuple[str, ...] = (get_form(inf, tense, pron),)
+                else:
+                    answers = PERFECT_ANSWERS[(inf, tense, pron)]
+                for ans in answers:
+                    index.setdefault(normalize_answer(ans), set()).add((inf, tense, pron))
+    return {ans: frozenset(keys) for ans, keys in index.items()}
+
+
+# Reverse lookup: answer -> questions it is correct for; one dict hit per check.
+ANSWER_INDEX: Dict[str, FrozenSet[Tuple[str, TenseCode, Pronoun]]] = _build_answer_index()
+
+
+def check_answer(answer: str) -> FrozenSet[Tuple[str, TenseCode, Pronoun]]:
+    """
+    Return all (infinitive, tense, pronoun) questions for which `answer` is correct
+    (compared after normalize_answer); empty if none.
+    """
+    return ANSWER_INDEX.get(normalize_answer(answer), frozenset())
 
 
 __all__ = [
     "PRONOUNS",
+    "PRONOUN_IDX",
+    "PronounIndex",
+    "Aux",
     "TENSES",
     "AUX_CONJUGATION",
     "VERBS",
     "ALL_VERBS",
     "SENTENCE_TEMPLATES",
+    "TEMPLATES_BY_TENSE",
+    "PERFECT_ANSWERS",
+    "FORMS",
+    "ANSWER_INDEX",
     "get_finite_form",
+    "get_form",
+    "check_answer",
+    "normalize_answer",
     "list_templates_for_tense",
     "list_verbs_for_template",
+    "render_template",
 ]
\ No newline at end of file